@@ -4,12 +4,27 @@ Architecture configuration management for the test framework.
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
+try:
+    from .utils import DATACLASS_SLOTS
+except ImportError:  # pragma: no cover - script-mode fallback
+    from utils import DATACLASS_SLOTS
+
+# Parsed configurations keyed on (path, mtime_ns, size); an edited file gets
+# a new key, so stale entries are never returned.
+_CONFIG_CACHE: Dict[Tuple[str, int, int], "ArchConfig"] = {}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ArchConfig:
     """Configuration for a specific architecture test."""
 
@@ -23,6 +38,11 @@ class ArchConfig:
     cstool_flags: List[str] = field(default_factory=list)
     description: str = ""
     category: str = "general"  # Can be used to group tests
+    # Filled by validate_config so the runner can size the cases file
+    # without statting it a second time.
+    cases_stat: Optional[os.stat_result] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -34,14 +54,36 @@ class ArchConfig:
             raise ValueError("cstool architecture cannot be empty")
 
 
+def _loads_json(raw: bytes) -> Any:
+    """Decode JSON bytes, preferring orjson when it is installed."""
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # handle both decoders with the same except clause.
+    if orjson is not None:
+        return orjson.loads(raw)  # pylint: disable=no-member
+    return json.loads(raw)
+
+
 def load_config(config_path: Path) -> ArchConfig:
-    """Load architecture configuration from JSON file."""
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    """Load architecture configuration from JSON file, reusing unchanged ones."""
+    try:
+        st = config_path.stat()
+    except OSError as e:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from e
+
+    key = (str(config_path), st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    config = _parse_config(config_path)
+    _CONFIG_CACHE[key] = config
+    return config
+
 
+def _parse_config(config_path: Path) -> ArchConfig:
+    """Parse a configuration file into an ArchConfig."""
     try:
-        with config_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _loads_json(config_path.read_bytes())
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in {config_path}: {e}") from e
 
@@ -85,27 +127,48 @@ def discover_arch_configs(test_root: Path) -> Dict[str, ArchConfig]:
     archs: Dict[str, ArchConfig] = {}
     arch_dir = test_root / "architectures"
 
-    if not arch_dir.exists():
+    try:
+        with os.scandir(arch_dir) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except FileNotFoundError:
         return archs
 
-    for sub in sorted(arch_dir.iterdir()):
-        if not sub.is_dir():
+    config_paths: List[Path] = []
+    for entry in entries:
+        # DirEntry answers is_dir() from the directory listing without a stat.
+        if not entry.is_dir():
             continue
 
-        config_path = sub / "config.json"
-        if not config_path.is_file():
-            continue
+        config_path = Path(entry.path) / "config.json"
+        if config_path.is_file():
+            config_paths.append(config_path)
 
-        try:
-            config = load_config(config_path)
-            archs[config.name] = config
-        except Exception as e:
-            print(f"Warning: Failed to load config from {config_path}: {e}")
+    if not config_paths:
+        return archs
+
+    # Loading is I/O bound, so threads overlap the reads on a cold cache.
+    # Results come back in path order and warnings are printed from here,
+    # keeping the output identical to a serial scan.
+    with ThreadPoolExecutor(max_workers=min(16, len(config_paths))) as executor:
+        loaded = list(executor.map(_try_load_config, config_paths))
+
+    for config_path, outcome in zip(config_paths, loaded):
+        if isinstance(outcome, Exception):
+            print(f"Warning: Failed to load config from {config_path}: {outcome}")
             continue
+        archs[outcome.name] = outcome
 
     return archs
 
 
+def _try_load_config(config_path: Path) -> Union[ArchConfig, Exception]:
+    """Load a configuration, returning the error instead of raising it."""
+    try:
+        return load_config(config_path)
+    except Exception as e:
+        return e
+
+
 def validate_config(config: ArchConfig) -> List[str]:
     """Validate an architecture configuration and return list of issues."""
     issues: List[str] = []
@@ -117,8 +180,12 @@ def validate_config(config: ArchConfig) -> List[str]:
     if not has_text_source and not has_yaml_source:
         issues.append("No test source configured (cases_file or yaml_source required)")
 
-    if has_text_source and not config.cases_file.exists():
-        issues.append(f"Test cases file not found: {config.cases_file}")
+    if has_text_source:
+        try:
+            config.cases_stat = os.stat(config.cases_file)
+        except OSError:
+            config.cases_stat = None
+            issues.append(f"Test cases file not found: {config.cases_file}")
 
     # Validate flag formats
     for flag in config.robustone_flags:
@@ -0,0 +1,90 @@
+"""
+Persistent cache of tool invocation results for the test framework.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+
+def binary_fingerprint(binary: Path) -> Optional[Tuple[str, int, int]]:
+    """Identify a binary build by its path, modification time and size."""
+    try:
+        stat = binary.stat()
+    except OSError:
+        return None
+    return str(binary), stat.st_mtime_ns, stat.st_size
+
+
+class ResultCache:
+    """SQLite-backed mapping from a command line to its (returncode, stdout, stderr).
+
+    Keys include the fingerprint of every tool binary, so rebuilding robustone
+    or cstool automatically turns previous entries into misses. Rows stored
+    for any other fingerprint are deleted when the cache is opened, so the
+    database only ever holds results for the current builds.
+    """
+
+    def __init__(self, path: Path, binaries: Sequence[Path]):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Location of the SQLite database file
+            binaries: Tool binaries whose builds the cached results depend on
+        """
+        self.path = path
+        self._fingerprint = tuple(binary_fingerprint(binary) for binary in binaries)
+        self._fingerprint_text = repr(self._fingerprint)
+        self._lock = threading.Lock()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tool_results ("
+            "key BLOB PRIMARY KEY, fingerprint TEXT, "
+            "returncode INTEGER, stdout TEXT, stderr TEXT)"
+        )
+        self._conn.execute(
+            "DELETE FROM tool_results WHERE fingerprint != ?",
+            (self._fingerprint_text,),
+        )
+        self._conn.commit()
+
+    def _key(self, cmd: List[str]) -> bytes:
+        material = repr((self._fingerprint, tuple(cmd))).encode("utf-8")
+        return hashlib.blake2b(material, digest_size=16).digest()
+
+    def get(self, cmd: List[str]) -> Optional[Tuple[int, str, str]]:
+        """Return the cached result for a command, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT returncode, stdout, stderr FROM tool_results WHERE key = ?",
+                (self._key(cmd),),
+            ).fetchone()
+        if row is None:
+            return None
+        return int(row[0]), row[1], row[2]
+
+    def put(self, cmd: List[str], result: Tuple[int, str, str]) -> None:
+        """Store the result of a command; call flush() to persist it."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tool_results VALUES (?, ?, ?, ?, ?)",
+                (self._key(cmd), self._fingerprint_text, *result),
+            )
+
+    def flush(self) -> None:
+        """Commit pending writes to disk."""
+        with self._lock:
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
@@ -2,18 +2,23 @@
 Output comparison functionality for the test framework.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
+import functools
 import json
 import re
 from typing import Any, Dict, List, Optional
 
 try:
-    from .utils import normalize_output
+    from .utils import DATACLASS_SLOTS, normalize_output
 except ImportError:  # pragma: no cover - script-mode fallback
-    from utils import normalize_output
+    from utils import DATACLASS_SLOTS, normalize_output
 
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
 
+
+@functools.lru_cache(maxsize=8192)
 def _extract_asm_text(tool_output: str) -> str:
     """
     Strip address/byte prefix from cstool/robustone output.
@@ -23,25 +28,24 @@ def _extract_asm_text(tool_output: str) -> str:
     - ' 0  fd 2f        jal\t0x7fe' → 'jal 0x7fe'
     - '.byte\t0xff' → '.byte 0xff'
     """
-    stripped = tool_output.strip()
-    if not stripped:
-        return ""
-    parts = stripped.split()
+    parts = tool_output.split()
 
     i = 0
     if parts and parts[0].isdigit():
         i = 1  # Skip address
 
     # Skip hex bytes (2-character hex strings)
-    while (
-        i < len(parts)
-        and len(parts[i]) == 2
-        and all(c in "0123456789abcdefABCDEF" for c in parts[i])
-    ):
+    while i < len(parts):
+        token = parts[i]
+        if (
+            len(token) != 2
+            or token[0] not in _HEX_DIGITS
+            or token[1] not in _HEX_DIGITS
+        ):
+            break
         i += 1
 
-    asm_parts = parts[i:]
-    return " ".join(asm_parts)
+    return " ".join(parts[i:])
 
 
 class ComparisonResult(Enum):
@@ -60,7 +64,7 @@ class ComparisonSurface(Enum):
     SEMANTIC_DETAIL = "semantic_detail"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SurfaceComparison:
     """Comparison result for one explicit surface."""
 
@@ -70,7 +74,7 @@ class SurfaceComparison:
     cstool_value: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TestCaseResult:
     """Result of a single test case."""
 
@@ -88,7 +92,7 @@ class TestCaseResult:
     surface_results: List[SurfaceComparison] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ArchTestSummary:
     """Summary of test results for an architecture."""
 
@@ -304,6 +308,30 @@ _MNEMONIC_EQUIVALENTS: Dict[str, str] = {
     "fmv.d.x": "fli.d",
 }
 
+# cstool detail-output patterns, compiled once: the semantic parser applies
+# them to every line of every instruction.
+_CSTOOL_INSN_LINE_RE = re.compile(r"^\s*[0-9a-fA-F]+\s+[0-9a-fA-F]{2}\s")
+_CSTOOL_OPCODE_ID_RE = re.compile(r"\(([^)]+)\)")
+_CSTOOL_OPERAND_TYPE_RE = re.compile(r"operands\[(\d+)\]\.type: ([A-Z]+)(?: = (.+))?$")
+_CSTOOL_MEM_BASE_RE = re.compile(r"operands\[(\d+)\]\.mem\.base: REG = (.+)$")
+_CSTOOL_MEM_DISP_RE = re.compile(r"operands\[(\d+)\]\.mem\.disp: (.+)$")
+_CSTOOL_ACCESS_RE = re.compile(r"operands\[(\d+)\]\.access: ([A-Z| ]+)$")
+_CSTOOL_TEXT_OPERANDS_RE = re.compile(
+    r"^[0-9a-f]+\s+(?:[0-9a-f]{2}\s+)+\S+(?:\s+(?P<operands>.+))?$"
+)
+
+# Numbered hardware performance-monitor CSRs and their base addresses.
+_RISCV_HPM_CSR_PATTERNS = (
+    (re.compile(r"mhpmevent([3-9]|[12][0-9]|3[01])"), 0x320),
+    (re.compile(r"mhpmcounter([3-9]|[12][0-9]|3[01])"), 0xB00),
+    (re.compile(r"mhpmcounter([3-9]|[12][0-9]|3[01])h"), 0xB80),
+)
+
+
+_FAILED_RESULTS = frozenset(
+    {ComparisonResult.MISMATCH, ComparisonResult.COMMAND_FAILURE}
+)
+
 
 class OutputComparator:
     """Handles comparison of robustone and cstool outputs."""
@@ -398,7 +426,7 @@ class OutputComparator:
         actual_norm = normalize_output(_extract_asm_text(actual))
         return expected_norm != actual_norm
 
-    def classify_result(  # pylint: disable=too-many-return-statements
+    def classify_result(
         self,
         expected: str,
         cstool_out: str,
@@ -424,29 +452,20 @@ class OutputComparator:
         # In strict mode, require all surfaces to match.
         # In loose mode, text match is sufficient (semantic_detail may diverge
         # due to alias expansion differences, e.g. c.sub vs sub).
-        if self.strict_match:
-            if not text_matched:
-                if command_failed:
-                    return ComparisonResult.COMMAND_FAILURE
-                if expected and self.check_documentation_drift(expected, cstool_out):
-                    return ComparisonResult.DOCUMENTATION_DRIFT
-                return ComparisonResult.MISMATCH
-
-            if all(surface.matched for surface in surface_results):
-                return ComparisonResult.MATCH
-
-            if command_failed:
-                return ComparisonResult.COMMAND_FAILURE
-            return ComparisonResult.MISMATCH
-
-        # Loose mode: text surface is authoritative
-        if text_matched:
+        if text_matched and (
+            not self.strict_match or all(s.matched for s in surface_results)
+        ):
             return ComparisonResult.MATCH
 
         if command_failed:
             return ComparisonResult.COMMAND_FAILURE
 
-        if expected and self.check_documentation_drift(expected, cstool_out):
+        # Drift only explains a text mismatch; it is never checked otherwise.
+        if (
+            not text_matched
+            and expected
+            and self.check_documentation_drift(expected, cstool_out)
+        ):
             return ComparisonResult.DOCUMENTATION_DRIFT
 
         return ComparisonResult.MISMATCH
@@ -535,23 +554,15 @@ class OutputComparator:
         """
         Generate a summary of test results.
         """
-        total_cases = len(results)
-        matches = sum(1 for r in results if r.result == ComparisonResult.MATCH)
-        mismatches = sum(1 for r in results if r.result == ComparisonResult.MISMATCH)
-        command_failures = sum(
-            1 for r in results if r.result == ComparisonResult.COMMAND_FAILURE
-        )
-        documentation_drifts = sum(
-            1 for r in results if r.result == ComparisonResult.DOCUMENTATION_DRIFT
-        )
+        counts = Counter(r.result for r in results)
 
         return ArchTestSummary(
             arch_name=arch_name,
-            total_cases=total_cases,
-            matches=matches,
-            mismatches=mismatches,
-            command_failures=command_failures,
-            documentation_drifts=documentation_drifts,
+            total_cases=len(results),
+            matches=counts[ComparisonResult.MATCH],
+            mismatches=counts[ComparisonResult.MISMATCH],
+            command_failures=counts[ComparisonResult.COMMAND_FAILURE],
+            documentation_drifts=counts[ComparisonResult.DOCUMENTATION_DRIFT],
             execution_time_ms=total_time_ms,
             results=results,
         )
@@ -561,16 +572,18 @@ class OutputComparator:
     ) -> List[TestCaseResult]:
         """
         Get list of failed test results.
+
+        Mismatches and command failures come first, followed by documentation
+        drifts when requested; each group keeps the original result order.
         """
-        failed = [
-            r
-            for r in results
-            if r.result in [ComparisonResult.MISMATCH, ComparisonResult.COMMAND_FAILURE]
-        ]
-        if include_drift:
-            failed.extend(
-                [r for r in results if r.result == ComparisonResult.DOCUMENTATION_DRIFT]
-            )
+        failed: List[TestCaseResult] = []
+        drifted: List[TestCaseResult] = []
+        for r in results:
+            if r.result in _FAILED_RESULTS:
+                failed.append(r)
+            elif include_drift and r.result is ComparisonResult.DOCUMENTATION_DRIFT:
+                drifted.append(r)
+        failed.extend(drifted)
         return failed
 
     def format_result_detailed(self, result: TestCaseResult) -> str:
@@ -659,7 +672,7 @@ class OutputComparator:
         blocks = []
         current_block: List[str] = []
         for line in output.splitlines():
-            if re.match(r"^\s*[0-9a-fA-F]+\s+[0-9a-fA-F]{2}\s", line):
+            if _CSTOOL_INSN_LINE_RE.match(line):
                 if current_block:
                     blocks.append("\n".join(current_block))
                 current_block = [line]
@@ -682,15 +695,13 @@ class OutputComparator:
     ) -> Dict[str, Any]:
         lines = [line.strip() for line in output.splitlines() if line.strip()]
         id_line = next((line for line in lines if line.startswith("ID:")), "")
-        id_match = re.search(r"\(([^)]+)\)", id_line)
+        id_match = _CSTOOL_OPCODE_ID_RE.search(id_line)
         if not id_match:
             raise ValueError("cstool semantic surface is missing opcode ID")
 
         operands: Dict[int, Dict[str, Any]] = {}
         for line in lines:
-            operand_match = re.match(
-                r"operands\[(\d+)\]\.type: ([A-Z]+)(?: = (.+))?$", line
-            )
+            operand_match = _CSTOOL_OPERAND_TYPE_RE.match(line)
             if operand_match:
                 index = int(operand_match.group(1))
                 operand_type = operand_match.group(2)
@@ -726,7 +737,7 @@ class OutputComparator:
                     )
                 continue
 
-            operand_match = re.match(r"operands\[(\d+)\]\.mem\.base: REG = (.+)$", line)
+            operand_match = _CSTOOL_MEM_BASE_RE.match(line)
             if operand_match:
                 index = int(operand_match.group(1))
                 operands.setdefault(
@@ -735,7 +746,7 @@ class OutputComparator:
                 )["base"] = self._riscv_register_id(operand_match.group(2))
                 continue
 
-            operand_match = re.match(r"operands\[(\d+)\]\.mem\.disp: (.+)$", line)
+            operand_match = _CSTOOL_MEM_DISP_RE.match(line)
             if operand_match:
                 index = int(operand_match.group(1))
                 operands.setdefault(
@@ -744,7 +755,7 @@ class OutputComparator:
                 )["displacement"] = self._parse_numeric_value(operand_match.group(2))
                 continue
 
-            operand_match = re.match(r"operands\[(\d+)\]\.access: ([A-Z| ]+)$", line)
+            operand_match = _CSTOOL_ACCESS_RE.match(line)
             if operand_match:
                 index = int(operand_match.group(1))
                 operands.setdefault(index, {"kind": "unknown", "access": ""})[
@@ -833,10 +844,7 @@ class OutputComparator:
     def _normalize_cstool_text_operands(
         self, instruction_line: str, decoded_operand_count: int
     ) -> List[Dict[str, Any]]:
-        match = re.match(
-            r"^[0-9a-f]+\s+(?:[0-9a-f]{2}\s+)+\S+(?:\s+(?P<operands>.+))?$",
-            instruction_line,
-        )
+        match = _CSTOOL_TEXT_OPERANDS_RE.match(instruction_line)
         if not match:
             return []
 
@@ -867,12 +875,9 @@ class OutputComparator:
         name = csr_name.strip().lower()
         if name.startswith("0x"):
             return int(name, 16)
-        if match := re.fullmatch(r"mhpmevent([3-9]|[12][0-9]|3[01])", name):
-            return 0x320 + int(match.group(1))
-        if match := re.fullmatch(r"mhpmcounter([3-9]|[12][0-9]|3[01])", name):
-            return 0xB00 + int(match.group(1))
-        if match := re.fullmatch(r"mhpmcounter([3-9]|[12][0-9]|3[01])h", name):
-            return 0xB80 + int(match.group(1))
+        for pattern, base in _RISCV_HPM_CSR_PATTERNS:
+            if match := pattern.fullmatch(name):
+                return base + int(match.group(1))
         if name not in _RISCV_CSR_IDS:
             raise ValueError(f"unknown RISC-V CSR `{csr_name}`")
         return _RISCV_CSR_IDS[name]
@@ -3,12 +3,16 @@ Main test runner for the Robustone test framework.
 """
 
 import ast
+import itertools
+import mmap
 import os
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
 from datetime import date
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Set, TextIO, Tuple
 
 try:
     import tomllib
@@ -24,6 +28,7 @@ sys.path.append(PROJECT_ROOT)
 # pylint: disable=wrong-import-position
 try:
     from .arch_config import ArchConfig, validate_config
+    from .cache import ResultCache
     from .comparator import (
         OutputComparator,
         TestCaseResult,
@@ -31,10 +36,18 @@ try:
         ComparisonResult,
         ComparisonSurface,
     )
-    from .utils import run_command, parse_test_case, find_repo_root
+    from .utils import (
+        clear_command_cache,
+        find_repo_root,
+        is_cacheable_result,
+        parse_test_case,
+        run_command,
+        run_commands_cached,
+    )
     from .yaml_loader import load_yaml_test_cases
 except ImportError:  # pragma: no cover - script-mode fallback
     from arch_config import ArchConfig, validate_config
+    from cache import ResultCache
     from comparator import (
         OutputComparator,
         TestCaseResult,
@@ -42,11 +55,28 @@ except ImportError:  # pragma: no cover - script-mode fallback
         ComparisonResult,
         ComparisonSurface,
     )
-    from utils import run_command, parse_test_case, find_repo_root
+    from utils import (
+        clear_command_cache,
+        find_repo_root,
+        is_cacheable_result,
+        parse_test_case,
+        run_command,
+        run_commands_cached,
+    )
     from yaml_loader import load_yaml_test_cases
 
 # pylint: enable=wrong-import-position
 
+# Text case files above this size are scanned through mmap instead of a
+# buffered text reader.
+_MMAP_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# (head, tail) argv parts placed around the hex input of each tool invocation.
+CommandTemplates = Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], ...]
+# Everything a CommandTemplates value is built from, besides the binaries:
+# (robustone_arch, robustone_flags, cstool_arch, cstool_flags).
+CommandTemplateKey = Tuple[str, Tuple[str, ...], str, Tuple[str, ...]]
+
 
 def _parse_known_differences_fallback(text: str) -> dict:
     """Parse the tiny known-differences TOML subset without third-party deps."""
@@ -92,6 +122,9 @@ class TestRunner:
         self,
         repo_root: Optional[Path] = None,
         comparator: Optional[OutputComparator] = None,
+        jobs: Optional[int] = None,
+        use_cache: bool = False,
+        release: bool = True,
     ):
         """
         Initialize the test runner.
@@ -99,13 +132,43 @@ class TestRunner:
         Args:
             repo_root: Path to repository root (auto-detected if None)
             comparator: Output comparator instance (default created if None)
+            jobs: Number of test cases to run concurrently across all
+                architectures (default: CPU count)
+            use_cache: Persist tool outputs across runs in target/test-cache.sqlite3
+            release: Test an optimized robustone build instead of the debug one
+
+        Raises:
+            ValueError: If jobs is not positive
         """
         self.repo_root = repo_root or find_repo_root()
         self.comparator = comparator or OutputComparator()
-        self.robustone_bin = self.repo_root / "target" / "debug" / "robustone"
+        if jobs is not None and jobs < 1:
+            raise ValueError(f"jobs must be a positive integer, got {jobs}")
+        self.jobs = jobs or os.cpu_count() or 1
+        self._print_lock = threading.Lock()
+        self._setup_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Submitted cases that have not finished yet, so close() can cancel
+        # the queued ones (shutdown(cancel_futures=True) needs Python 3.9).
+        self._pending: Set[Future] = set()
+        self._cancelled = False
+        # Every case spawns robustone twice, so an optimized build pays for
+        # its longer compile on all but the smallest runs.
+        self.release = release
+        self.robustone_bin = (
+            self.repo_root
+            / "target"
+            / ("release" if release else "debug")
+            / "robustone"
+        )
         self.cstool_bin = (
             self.repo_root / "third_party" / "capstone" / "cstool" / "cstool"
         )
+        self.cache_path = (
+            self.repo_root / "target" / "test-cache.sqlite3" if use_cache else None
+        )
+        self._result_cache: Optional[ResultCache] = None
+        self._command_templates: Dict[CommandTemplateKey, CommandTemplates] = {}
         self.known_differences = self._load_known_differences()
 
     def ensure_binaries(self, verbose: bool = False) -> None:
@@ -129,9 +192,13 @@ class TestRunner:
             "--bin",
             "robustone",
         ]
+        if self.release:
+            build_cmd.append("--release")
         code, _, err = run_command(build_cmd)
         if code != 0:
             raise RuntimeError(f"Failed to build robustone: {err}")
+        # The build may have replaced the binary, so earlier results are stale
+        clear_command_cache()
 
         # Check cstool binary
         if not self.cstool_bin.exists():
@@ -159,6 +226,7 @@ class TestRunner:
         expected: str,
         note: str,
         verbose: bool = False,
+        stream: Optional[TextIO] = None,
     ) -> TestCaseResult:
         """
         Run a single test case.
@@ -169,6 +237,7 @@ class TestRunner:
             expected: Expected output from documentation
             note: Optional note
             verbose: Whether to print detailed progress
+            stream: Where to write progress (default: stdout)
 
         Returns:
             TestCaseResult
@@ -184,46 +253,32 @@ class TestRunner:
                     cstool_arch = part[len("cstool_arch=") :].strip()
                     break
 
-        # Build commands
-        robustone_cmd = [
-            str(self.robustone_bin),
-            "--detailed",
+        # Build commands from the per-architecture prefixes
+        template_key = (
             config.robustone_arch,
-            hex_input,
-        ] + config.robustone_flags
+            tuple(config.robustone_flags),
+            cstool_arch,
+            tuple(config.cstool_flags),
+        )
+        templates = self._command_templates.get(template_key)
+        if templates is None:
+            templates = self._build_command_templates(config, cstool_arch)
+            self._command_templates[template_key] = templates
+        commands = [[*head, hex_input, *tail] for head, tail in templates]
 
         if verbose:
-            print(f"Running Command: {robustone_cmd}")
-
-        cstool_cmd = [
-            str(self.cstool_bin),
-            cstool_arch,
-            hex_input,
-        ] + config.cstool_flags
-        semantic_robustone_cmd = [
-            str(self.robustone_bin),
-            "--json",
-            "--detailed",
-            "--real-detail",
-            config.robustone_arch,
-            hex_input,
-        ] + config.robustone_flags
-        semantic_cstool_cmd = [
-            str(self.cstool_bin),
-            "-d",
-            "-r",
-            cstool_arch,
-            hex_input,
-        ] + config.cstool_flags
+            self._log(f"Running Command: {commands[0]}", stream)
 
-        # Execute commands
-        rob_code, rob_out, rob_err = run_command(robustone_cmd)
-        cs_code, cs_out, cs_err = run_command(cstool_cmd)
-        rob_sem_code, rob_sem_out, rob_sem_err = run_command(semantic_robustone_cmd)
-        cs_sem_code, cs_sem_out, cs_sem_err = run_command(semantic_cstool_cmd)
+        # Execute commands; they are independent, so run them concurrently
+        (
+            (rob_code, rob_out, rob_err),
+            (cs_code, cs_out, cs_err),
+            (rob_sem_code, rob_sem_out, rob_sem_err),
+            (cs_sem_code, cs_sem_out, cs_sem_err),
+        ) = self._run_commands(commands)
 
         if verbose:
-            print(f"Running Result: {rob_out}")
+            self._log(f"Running Result: {rob_out}", stream)
         execution_time = int((time.time() - start_time) * 1000)
 
         # Create result
@@ -246,6 +301,50 @@ class TestRunner:
             cstool_semantic_stderr=cs_sem_err,
         )
 
+    def _build_command_templates(
+        self, config: ArchConfig, cstool_arch: str
+    ) -> CommandTemplates:
+        """
+        Build the constant (head, tail) argv parts around the hex input.
+
+        Returns templates for the robustone text, cstool text, robustone
+        semantic and cstool semantic invocations, in that order.
+        """
+        robustone = str(self.robustone_bin)
+        cstool = str(self.cstool_bin)
+        robustone_flags = tuple(config.robustone_flags)
+        cstool_flags = tuple(config.cstool_flags)
+        return (
+            ((robustone, "--detailed", config.robustone_arch), robustone_flags),
+            ((cstool, cstool_arch), cstool_flags),
+            (
+                (
+                    robustone,
+                    "--json",
+                    "--detailed",
+                    "--real-detail",
+                    config.robustone_arch,
+                ),
+                robustone_flags,
+            ),
+            ((cstool, "-d", "-r", cstool_arch), cstool_flags),
+        )
+
+    def _run_commands(self, cmds: List[List[str]]) -> List[Tuple[int, str, str]]:
+        """Run tool commands, consulting the persistent result cache if enabled."""
+        if self._result_cache is None:
+            return run_commands_cached(cmds)
+
+        results = [self._result_cache.get(cmd) for cmd in cmds]
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            fresh = run_commands_cached([cmds[index] for index in missing])
+            for index, result in zip(missing, fresh):
+                results[index] = result
+                if is_cacheable_result(result):
+                    self._result_cache.put(cmds[index], result)
+        return results
+
     def _load_known_differences(self) -> dict:
         """Load active known-difference entries keyed by (arch, hex_input, surface)."""
         path = self.repo_root / "tests" / "differential" / "known-differences.toml"
@@ -377,15 +476,20 @@ class TestRunner:
         limit: Optional[int] = None,
         verbose: bool = False,
         fail_fast: bool = False,
+        stream: Optional[TextIO] = None,
     ) -> ArchTestSummary:
         """
         Run all tests for a specific architecture.
 
+        Several architectures may run at once from different threads; their
+        cases share one worker pool, so --jobs bounds the whole run.
+
         Args:
             config: Architecture configuration
             limit: Optional limit on number of test cases to run
             verbose: Whether to print detailed progress
             fail_fast: Stop on first failure
+            stream: Where to write progress (default: stdout)
 
         Returns:
             ArchTestSummary with all results
@@ -397,85 +501,187 @@ class TestRunner:
                 f"Invalid configuration for {config.name}: {'; '.join(issues)}"
             )
 
+        # Command results stay cached across architectures: keys are full
+        # argv, so suites that share instructions reuse each other's runs.
+        with self._setup_lock:
+            if self._cancelled:
+                raise RuntimeError("test run was cancelled")
+            if self.cache_path is not None and self._result_cache is None:
+                self._result_cache = ResultCache(
+                    self.cache_path, [self.robustone_bin, self.cstool_bin]
+                )
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.jobs)
+            executor = self._executor
+
         # Load test cases
-        test_cases = self._load_test_cases(config)
-        if limit is not None:
-            test_cases = test_cases[:limit]
+        test_cases = list(itertools.islice(self._iter_test_cases(config), limit))
 
         if not test_cases:
             if verbose:
                 source = config.yaml_source or config.cases_file
-                print(f"Warning: No test cases found in {source}")
+                self._log(f"Warning: No test cases found in {source}", stream)
             # Return empty summary instead of raising error
             return self.comparator.generate_summary(config.name, [], 0)
 
         if verbose:
-            print(f"Running {len(test_cases)} test cases for {config.name}...")
+            self._log(
+                f"Running {len(test_cases)} test cases for {config.name}...", stream
+            )
             source = config.yaml_source or config.cases_file
             if source is not None:
                 try:
-                    print(f"Test file: {Path(source).relative_to(self.repo_root)}")
+                    source = Path(source).relative_to(self.repo_root)
                 except ValueError:
-                    print(f"Test file: {source}")
+                    pass
+                self._log(f"Test file: {source}", stream)
 
         start_time = time.time()
-        results: List[TestCaseResult] = []
-
-        for i, (hex_input, expected, note) in enumerate(test_cases, start=1):
-            if verbose:
-                print(f"[{i:3d}/{len(test_cases)}] Testing {hex_input}")
+        indexed_results: List[Tuple[int, TestCaseResult]] = []
+        total = len(test_cases)
+
+        # Each case is dominated by subprocess wait time, which releases the
+        # GIL, so a thread pool is enough to overlap them.
+        futures = {}
+        for i, (hex_input, expected, note) in enumerate(test_cases):
+            future = executor.submit(
+                self._run_indexed_test_case,
+                config,
+                i,
+                total,
+                (hex_input, expected, note),
+                verbose,
+                stream,
+            )
+            self._pending.add(future)
+            future.add_done_callback(self._pending.discard)
+            futures[future] = i
 
-            result = self.run_test_case(config, hex_input, expected, note, verbose)
-            result = self.apply_known_difference(config.name, result)
-            results.append(result)
+        for future in as_completed(futures):
+            result = future.result()
+            indexed_results.append((futures[future], result))
 
             # Print immediate result
             if result.result.value == "match":
                 if verbose:
-                    print(f"  ✓ {hex_input}")
+                    self._log(f"  ✓ {result.hex_input}", stream)
             else:
-                print(f"  ✗ {hex_input} ({result.result.value})")
+                self._log(f"  ✗ {result.hex_input} ({result.result.value})", stream)
                 if fail_fast:
+                    for pending in futures:
+                        pending.cancel()
+                    # Let cases already running finish so they cannot log
+                    # after this architecture's summary.
+                    wait(futures)
                     break
 
+        indexed_results.sort(key=lambda item: item[0])
+        results = [result for _, result in indexed_results]
+        if self._result_cache is not None:
+            self._result_cache.flush()
+
         total_time = int((time.time() - start_time) * 1000)
         return self.comparator.generate_summary(config.name, results, total_time)
 
-    def _load_test_cases(self, config: ArchConfig) -> List[tuple]:
+    def _run_indexed_test_case(
+        self,
+        config: ArchConfig,
+        index: int,
+        total: int,
+        test_case: Tuple[str, str, str],
+        verbose: bool,
+        stream: Optional[TextIO],
+    ) -> TestCaseResult:
+        """Run one test case from a pool worker and apply known differences."""
+        if self._cancelled:
+            raise RuntimeError("test run was cancelled")
+        hex_input, expected, note = test_case
+        if verbose:
+            self._log(f"[{index + 1:3d}/{total}] Testing {hex_input}", stream)
+
+        result = self.run_test_case(config, hex_input, expected, note, verbose, stream)
+        return self.apply_known_difference(config.name, result)
+
+    def _log(self, message: str, stream: Optional[TextIO] = None) -> None:
+        """Print a progress line without interleaving output from workers."""
+        with self._print_lock:
+            print(message, file=stream)
+
+    def cancel(self) -> None:
+        """
+        Stop running cases for all architectures.
+
+        Queued cases fail without spawning anything, so concurrent
+        run_arch_tests calls end with an error; cases already running finish.
+        """
+        # Queued futures are failed by the workers rather than cancelled:
+        # Future.cancel() does not wake threads blocked in as_completed().
+        with self._setup_lock:
+            self._cancelled = True
+
+    def close(self) -> None:
+        """Shut down the shared worker pool and close the result cache."""
+        with self._setup_lock:
+            if self._executor is not None:
+                for future in list(self._pending):
+                    future.cancel()
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._result_cache is not None:
+                self._result_cache.close()
+                self._result_cache = None
+
+    def _iter_test_cases(self, config: ArchConfig) -> Iterator[Tuple[str, str, str]]:
         """
-        Load test cases from the configured source.
+        Lazily yield test cases from the configured source.
 
-        Supports both legacy text files and Capstone YAML sources.
+        Supports both legacy text files and Capstone YAML sources. Large text
+        files are scanned through a read-only memory map.
 
         Args:
             config: Architecture configuration
 
-        Returns:
-            List of (hex_input, expected, note) tuples
+        Yields:
+            (hex_input, expected, note) tuples
         """
         # YAML source takes precedence if configured
         if config.yaml_source is not None:
-            return list(
-                load_yaml_test_cases(
-                    config.yaml_source,
-                    yaml_filter=config.yaml_filter,
-                )
+            yield from load_yaml_test_cases(
+                config.yaml_source,
+                yaml_filter=config.yaml_filter,
             )
+            return
 
         # Fall back to legacy text format
-        test_cases = []
+        cases_stat = config.cases_stat or config.cases_file.stat()
+        if cases_stat.st_size > _MMAP_THRESHOLD_BYTES:
+            with config.cases_file.open("rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm:
+                for raw_line in iter(mm.readline, b""):
+                    # Drop blank and comment lines before paying for a decode
+                    raw_line = raw_line.strip()
+                    if not raw_line or raw_line.startswith(b"#"):
+                        continue
+                    hex_input, expected, note = parse_test_case(
+                        raw_line.decode("utf-8")
+                    )
+                    if hex_input:
+                        yield hex_input, expected, note
+            return
+
         with config.cases_file.open("r", encoding="utf-8") as f:
-            for _, line in enumerate(f, start=1):
+            for line in f:
                 hex_input, expected, note = parse_test_case(line)
                 if hex_input:  # Skip empty lines and comments
-                    test_cases.append((hex_input, expected, note))
-        return test_cases
+                    yield hex_input, expected, note
 
     def print_summary(
         self,
         summary: ArchTestSummary,
         show_failures: int = 10,
         show_details: bool = False,
+        stream: Optional[TextIO] = None,
     ) -> None:
         """
         Print test summary to stdout.
@@ -484,49 +690,56 @@ class TestRunner:
             summary: Test summary to print
             show_failures: Number of failures to show in detail
             show_details: Whether to show detailed failure information
+            stream: Where to write the summary (default: stdout)
         """
-        print(f"\n{'='*60}")
-        print(f"Results for {summary.arch_name}:")
-        print(f"{'='*60}")
-        print(f"Total cases:     {summary.total_cases}")
         success_rate = (
             (summary.matches / summary.total_cases * 100)
             if summary.total_cases > 0
             else 0.0
         )
-        print(f"Matches:         {summary.matches} ({success_rate:.1f}%)")
-        print(f"Mismatches:      {summary.mismatches}")
-        print(f"Command failures: {summary.command_failures}")
-        print(f"Documentation drift: {summary.documentation_drifts}")
-        print(f"Execution time:  {summary.execution_time_ms}ms")
+        # Build the whole report and write it once instead of issuing a
+        # print() (and a write on unbuffered pipes) per line.
+        lines = [
+            "",
+            "=" * 60,
+            f"Results for {summary.arch_name}:",
+            "=" * 60,
+            f"Total cases:     {summary.total_cases}",
+            f"Matches:         {summary.matches} ({success_rate:.1f}%)",
+            f"Mismatches:      {summary.mismatches}",
+            f"Command failures: {summary.command_failures}",
+            f"Documentation drift: {summary.documentation_drifts}",
+            f"Execution time:  {summary.execution_time_ms}ms",
+        ]
 
         failed_results = self.comparator.get_failed_results(summary.results)
         if failed_results:
-            print(
-                f"\nFailures (showing first {min(show_failures, len(failed_results))}):"
+            lines.append("")
+            lines.append(
+                f"Failures (showing first {min(show_failures, len(failed_results))}):"
             )
-            print("-" * 60)
+            lines.append("-" * 60)
 
             for i, result in enumerate(failed_results[:show_failures], start=1):
-                print(f"\n{i}. {result.hex_input} ({result.result.value})")
+                lines.append("")
+                lines.append(f"{i}. {result.hex_input} ({result.result.value})")
                 if show_details:
-                    print(self.comparator.format_result_detailed(result))
+                    lines.append(self.comparator.format_result_detailed(result))
                 else:
                     if result.expected_output:
-                        print(f"   Expected: {result.expected_output}")
+                        lines.append(f"   Expected: {result.expected_output}")
                     if result.note:
-                        print(f"   Note:     {result.note}")
-                    print(f"   Robustone: {result.robustone_output}")
-                    print(f"   Cstool:    {result.cstool_output}")
+                        lines.append(f"   Note:     {result.note}")
+                    lines.append(f"   Robustone: {result.robustone_output}")
+                    lines.append(f"   Cstool:    {result.cstool_output}")
 
         if len(failed_results) > show_failures:
-            print(f"\n... and {len(failed_results) - show_failures} more failures")
+            lines.append("")
+            lines.append(f"... and {len(failed_results) - show_failures} more failures")
 
-        success_rate = (
-            (summary.matches / summary.total_cases * 100)
-            if summary.total_cases > 0
-            else 0.0
-        )
-        print(f"\nOverall success rate: {success_rate:.1f}%")
+        lines.append("")
+        lines.append(f"Overall success rate: {success_rate:.1f}%")
         if success_rate == 100.0 and summary.total_cases > 0:
-            print("🎉 All tests passed!")
+            lines.append("🎉 All tests passed!")
+
+        (stream or sys.stdout).write("\n".join(lines) + "\n")
@@ -2,19 +2,108 @@
 Utility functions for the test framework.
 """
 
+import functools
+import os
 import subprocess
 import re
+import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import List, Mapping, Tuple, Optional
+
+CommandKey = Tuple[Tuple[str, ...], Optional[int]]
+
+_COMMAND_CACHE_SIZE = 4096
+_command_cache: "OrderedDict[CommandKey, Tuple[int, str, str]]" = OrderedDict()
+_command_cache_lock = threading.Lock()
+
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+
+# dataclass(slots=True) only exists on Python 3.10+; older interpreters
+# get ordinary dataclasses with a per-instance __dict__.
+DATACLASS_SLOTS: Mapping[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+# Environment for the robustone/cstool runs under test. A small environment
+# (no locale to load) makes each launch measurably cheaper, but it must still
+# carry what the binaries and their instrumentation read: loader paths,
+# RUST_BACKTRACE and friends, sanitizer options, and coverage/profiling
+# output locations.
+_TOOL_ENV_NAMES = frozenset(
+    (
+        "PATH",
+        "HOME",
+        "TMPDIR",
+        "SYSTEMROOT",
+        "LD_LIBRARY_PATH",
+        "LD_PRELOAD",
+        "DYLD_LIBRARY_PATH",
+        "DYLD_INSERT_LIBRARIES",
+    )
+)
+_TOOL_ENV_PREFIXES = (
+    "RUST_",
+    "CARGO_",
+    "ASAN_",
+    "LSAN_",
+    "MSAN_",
+    "TSAN_",
+    "UBSAN_",
+    "LLVM_PROFILE_",
+    "GCOV_",
+)
+TOOL_ENV: Mapping[str, str] = {
+    name: value
+    for name, value in os.environ.items()
+    if name in _TOOL_ENV_NAMES or name.startswith(_TOOL_ENV_PREFIXES)
+}
+
+
+class _NotRun(tuple):
+    """A (returncode, stdout, stderr) result for a command that did not run."""
+
+
+def _not_run(exc: Exception) -> Tuple[int, str, str]:
+    """Describe a command whose process could not be started or waited on."""
+    return _NotRun((1, "", f"Failed to run command: {exc}"))
+
+
+def is_cacheable_result(result: Tuple[int, str, str]) -> bool:
+    """
+    Tell whether a command result reflects the tool's own behaviour.
+
+    Timeouts and commands whose process never ran (e.g. spawning failed with
+    EMFILE or EAGAIN) depend on the machine's state at the time, so they must
+    not be reused for later runs.
 
+    Args:
+        result: (returncode, stdout, stderr) as returned by run_command(s)
 
-def run_command(cmd: List[str], timeout: Optional[int] = 60) -> Tuple[int, str, str]:
+    Returns:
+        True if the result may be cached
+    """
+    return result[0] != 124 and not isinstance(result, _NotRun)
+
+
+def _decode_output(raw: bytes) -> str:
+    """Decode captured process output in a single pass and trim it."""
+    return raw.decode("utf-8", "replace").strip()
+
+
+def run_command(
+    cmd: List[str],
+    timeout: Optional[int] = 60,
+    env: Optional[Mapping[str, str]] = None,
+) -> Tuple[int, str, str]:
     """
     Run a command and return (returncode, stdout, stderr).
 
     Args:
         cmd: Command to execute as a list of strings
         timeout: Optional timeout in seconds (default: 60)
+        env: Environment for the command (default: inherit the current one)
 
     Returns:
         Tuple of (returncode, stdout, stderr)
@@ -22,29 +111,166 @@ def run_command(cmd: List[str], timeout: Optional[int] = 60) -> Tuple[int, str,
     try:
         result = subprocess.run(
             cmd,
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
             timeout=timeout,
             check=False,
+            env=env,
+            # CPython only launches children with posix_spawn (vfork semantics
+            # on Linux, no page-table copy of the parent) when close_fds is
+            # False. Descriptors Python opens are non-inheritable by default
+            # (PEP 446), so nothing leaks into the tools.
+            close_fds=False,
+        )
+        return (
+            result.returncode,
+            _decode_output(result.stdout),
+            _decode_output(result.stderr),
         )
-        return result.returncode, result.stdout.strip(), result.stderr.strip()
     except subprocess.TimeoutExpired:
         return 124, "", f"Command timed out after {timeout} seconds: {' '.join(cmd)}"
     except Exception as exc:
-        return 1, "", f"Failed to run command: {exc}"
+        return _not_run(exc)
 
 
+def run_commands(
+    cmds: List[List[str]], timeout: Optional[int] = 60
+) -> List[Tuple[int, str, str]]:
+    """
+    Run independent commands concurrently and return their results in order.
+
+    Every process is started before any of them is waited on, so their
+    execution overlaps instead of running back to back. Commands run with
+    the minimal TOOL_ENV environment.
+
+    Args:
+        cmds: Commands to execute, each as a list of strings
+        timeout: Optional timeout in seconds applied to each command (default: 60)
+
+    Returns:
+        List of (returncode, stdout, stderr) tuples, one per command
+    """
+    processes: List[Optional[subprocess.Popen]] = []
+    results: List[Tuple[int, str, str]] = []
+    for cmd in cmds:
+        try:
+            process = subprocess.Popen(  # pylint: disable=consider-using-with
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                close_fds=False,  # keeps the posix_spawn fast path, see run_command
+                env=TOOL_ENV,
+            )
+        except Exception as exc:
+            processes.append(None)
+            results.append(_not_run(exc))
+            continue
+        processes.append(process)
+        results.append((0, "", ""))
+
+    try:
+        for index, process in enumerate(processes):
+            if process is None:
+                continue
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                results[index] = (
+                    124,
+                    "",
+                    f"Command timed out after {timeout} seconds: "
+                    f"{' '.join(cmds[index])}",
+                )
+                continue
+            except Exception as exc:
+                results[index] = _not_run(exc)
+                continue
+            results[index] = (
+                process.returncode,
+                _decode_output(stdout),
+                _decode_output(stderr),
+            )
+    finally:
+        # On an error or interrupt, do not leave started tools running or
+        # unreaped.
+        for process in processes:
+            if process is not None and process.returncode is None:
+                process.kill()
+                process.communicate()
+
+    return results
+
+
+def run_commands_cached(
+    cmds: List[List[str]], timeout: Optional[int] = 60
+) -> List[Tuple[int, str, str]]:
+    """
+    Run commands like run_commands, reusing results of identical invocations.
+
+    Test suites often repeat the same instruction, so results are kept in a
+    bounded in-memory LRU cache keyed on the exact command line. Commands
+    that time out or fail to run are not cached.
+
+    Args:
+        cmds: Commands to execute, each as a list of strings
+        timeout: Optional timeout in seconds applied to each command (default: 60)
+
+    Returns:
+        List of (returncode, stdout, stderr) tuples, one per command
+    """
+    keys: List[CommandKey] = [(tuple(cmd), timeout) for cmd in cmds]
+    results: List[Optional[Tuple[int, str, str]]] = [None] * len(cmds)
+    missing: List[int] = []
+
+    with _command_cache_lock:
+        for index, key in enumerate(keys):
+            cached = _command_cache.get(key)
+            if cached is None:
+                missing.append(index)
+                continue
+            _command_cache.move_to_end(key)
+            results[index] = cached
+
+    if missing:
+        fresh = run_commands([cmds[index] for index in missing], timeout)
+        with _command_cache_lock:
+            for index, result in zip(missing, fresh):
+                results[index] = result
+                if not is_cacheable_result(result):
+                    continue
+                _command_cache[keys[index]] = result
+                if len(_command_cache) > _COMMAND_CACHE_SIZE:
+                    _command_cache.popitem(last=False)
+
+    return results
+
+
+def clear_command_cache() -> None:
+    """Drop all cached command results, e.g. after rebuilding a binary."""
+    with _command_cache_lock:
+        _command_cache.clear()
+
+
+@functools.lru_cache(maxsize=8192)
 def normalize_output(output: str) -> str:
     """
     Normalize output string for comparison by collapsing whitespace.
 
+    Results are memoized: the comparator normalizes the same short outputs
+    several times per test case, and suites repeat instructions.
+
     Args:
         output: Raw output string
 
     Returns:
         Normalized output string with consistent whitespace
     """
+    # str.split()/join stays in C and beats a precompiled r"\s+" regex
+    # substitution at every output size the harness produces.
     return " ".join(output.split())
 
 
@@ -64,7 +290,13 @@ def find_repo_root(start_path: Optional[Path] = None) -> Path:
     if start_path is None:
         start_path = Path.cwd()
 
-    current = start_path.resolve()
+    return _find_repo_root_cached(str(start_path.resolve()))
+
+
+@functools.lru_cache(maxsize=32)
+def _find_repo_root_cached(start: str) -> Path:
+    """Walk up from a resolved start path; memoized per start directory."""
+    current = Path(start)
     while current != current.parent:
         if (current / ".git").exists():
             return current
@@ -119,29 +351,24 @@ def parse_test_case(line: str) -> Tuple[str, str, str]:
     Returns:
         Tuple of (hex_input, expected_output, note)
     """
+    # Locate the separators by index and slice once instead of splitting
+    # into intermediate lists; this runs for every line of a cases file.
     line = line.strip()
-    if not line or line.startswith("#"):
+    if not line or line[0] == "#":
         return "", "", ""
 
-    # Split on first #
-    if "#" not in line:
+    hash_pos = line.find("#")
+    if hash_pos < 0:
         return line, "", ""
 
-    hex_input, right = [seg.strip() for seg in line.split("#", 1)]
+    hex_input = line[:hash_pos].rstrip()
+    right = line[hash_pos + 1 :]
 
-    if "|" in right:
-        parts = right.split("|", 1)
-        if len(parts) == 2:
-            expected_output = parts[0].strip()
-            note = parts[1].strip()
-        else:
-            expected_output = right.strip()
-            note = ""
-    else:
-        expected_output = right.strip()
-        note = ""
+    pipe_pos = right.find("|")
+    if pipe_pos < 0:
+        return hex_input, right.strip(), ""
 
-    return hex_input, expected_output, note
+    return hex_input, right[:pipe_pos].strip(), right[pipe_pos + 1 :].strip()
 
 
 def format_test_result(
@@ -196,7 +423,7 @@ def safe_filename(name: str) -> str:
     """
 
     # Remove or replace unsafe characters
-    safe = re.sub(r'[<>:"/\\|?*]', "_", name)
+    safe = _UNSAFE_FILENAME_RE.sub("_", name)
     # Remove leading/trailing spaces and dots
     safe = safe.strip(". ")
     # Ensure it's not empty
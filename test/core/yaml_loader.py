@@ -6,6 +6,8 @@ and produces the same (hex_input, expected_output, note) tuples that
 the existing text-based loader produces.
 """
 
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Iterator, List, Optional, Set, Tuple
 
@@ -17,6 +19,10 @@ except ImportError as _exc:  # pragma: no cover
         "Install it with: pip install PyYAML"
     ) from _exc
 
+# libyaml's C parser is several times faster than the pure-Python one on
+# Capstone's large MC files; PyYAML builds without libyaml lack it.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 # Mapping from Capstone arch+mode combinations to Robustone arch names.
 # The mode set is matched as a subset: the YAML options must contain AT
@@ -222,9 +228,50 @@ MODE_OPTIONS: Set[str] = ALL_MODE_OPTIONS
 SUPPORTED_MODE_OPTIONS: Set[str] = ALL_MODE_OPTIONS
 
 
+# Parsed YAML files, grouped by the yaml_source that loaded them. Only the
+# sources used most recently are kept: capstone-riscv32-mc and
+# capstone-riscv64-mc both read tests/MC/RISCV and run back to back (or
+# side by side), so the second one reuses the first one's parse. Other
+# architectures read disjoint trees, and keeping those documents alive for
+# a whole --all run would only hold memory.
+_SOURCE_CACHE_SIZE = 2
+# path -> (mtime_ns, size, parsed test cases)
+_ParsedFiles = Dict[str, Tuple[int, int, Optional[List[dict]]]]
+_source_cache: "OrderedDict[str, _ParsedFiles]" = OrderedDict()
+_source_cache_lock = threading.Lock()
+
+
+def _source_file_cache(yaml_source: str) -> _ParsedFiles:
+    """Return the per-file parse cache of a yaml_source, evicting old sources."""
+    with _source_cache_lock:
+        files = _source_cache.get(yaml_source)
+        if files is None:
+            files = {}
+            _source_cache[yaml_source] = files
+            if len(_source_cache) > _SOURCE_CACHE_SIZE:
+                _source_cache.popitem(last=False)
+        else:
+            _source_cache.move_to_end(yaml_source)
+        return files
+
+
+def _load_yaml_file(path: str) -> Optional[List[dict]]:
+    """Parse one YAML file and return its test cases, or None if unusable."""
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            data = yaml.load(fh, Loader=_SafeLoader)
+    except yaml.YAMLError:
+        # Skip malformed YAML files gracefully
+        return None
+
+    if not isinstance(data, dict):
+        return None
+    return data.get("test_cases", [])
+
+
 def _bytes_to_hex(byte_list: List[int]) -> str:
     """Convert a list of byte ints to a contiguous lowercase hex string."""
-    return "".join(f"{b:02x}" for b in byte_list)
+    return bytes(byte_list).hex()
 
 
 def _resolve_arch(options: List[str]) -> Optional[str]:
@@ -621,19 +668,21 @@ def load_yaml_test_cases(
     else:
         yaml_files = [source_path]
 
+    parsed = _source_file_cache(yaml_source)
     count = 0
     for yaml_file in yaml_files:
-        try:
-            with yaml_file.open("r", encoding="utf-8") as fh:
-                data = yaml.safe_load(fh)
-        except yaml.YAMLError:
-            # Skip malformed YAML files gracefully
-            continue
-
-        if not isinstance(data, dict):
+        st = yaml_file.stat()
+        path = str(yaml_file)
+        cached = parsed.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            test_cases = cached[2]
+        else:
+            test_cases = _load_yaml_file(path)
+            parsed[path] = (st.st_mtime_ns, st.st_size, test_cases)
+        if test_cases is None:
             continue
 
-        for test_case in data.get("test_cases", []):
+        for test_case in test_cases:
             if not filt.matches(test_case):
                 continue
 
@@ -13,47 +13,112 @@ Usage:
 """
 
 import argparse
+import functools
+import io
+import mmap
+import re
 import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, TextIO, Tuple
 
+# The runner and comparator pull in YAML parsing and the rest of the
+# execution stack; they are imported in run_tests() so --list, --init and
+# --help only pay for arch_config.
 try:
-    from test.core.test_runner import TestRunner
-    from test.core.arch_config import discover_arch_configs, create_sample_config
-    from test.core.comparator import OutputComparator
+    from test.core.arch_config import (
+        ArchConfig,
+        discover_arch_configs,
+        create_sample_config,
+    )
 except ImportError:  # pragma: no cover - direct script fallback
+    from core.arch_config import ArchConfig, discover_arch_configs, create_sample_config
+
+if TYPE_CHECKING:  # pragma: no cover
+    from core.comparator import ArchTestSummary
     from core.test_runner import TestRunner
-    from core.arch_config import discover_arch_configs, create_sample_config
-    from core.comparator import OutputComparator
+
+_TEST_ROOT = Path(__file__).parent
+
+# A case line contains "#" and its first non-blank byte is not "#".
+_CASE_LINE_RE = re.compile(rb"(?m)^[^\S\n]*[^#\s][^\n]*?#")
+
+# Same cut-off as the runner: larger cases files are scanned through mmap
+# rather than read into one bytes object.
+_MMAP_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=4)
+def _discover_cached(test_root: str) -> Dict[str, ArchConfig]:
+    return discover_arch_configs(Path(test_root))
+
+
+def _discover(test_root: Path) -> Dict[str, ArchConfig]:
+    """
+    Discover architecture configurations, reusing earlier scans.
+
+    Repeated main() calls in one process (e.g. from a test harness) skip the
+    directory walk; callers get their own copy of the mapping.
+    """
+    return dict(_discover_cached(str(test_root)))
+
+
+def invalidate_arch_cache() -> None:
+    """Forget discovered architectures, e.g. after one was added."""
+    _discover_cached.cache_clear()
 
 
 def list_architectures(test_root: Path) -> None:
     """List all available architectures."""
-    archs = discover_arch_configs(test_root)
+    archs = _discover(test_root)
     if not archs:
         print("No architecture configurations found.")
         print("Create one with: python3 test/run_tests.py --init <arch_name>")
         return
 
     print("Available architectures:")
-    print("-" * 40)
-    for name, config in sorted(archs.items()):
-        cases_count = _count_test_cases(config)
-        print(f"  {name:<15} ({cases_count:3d} cases) - {config.description}")
+    print("-" * 40, flush=True)
+    names = sorted(archs)
+    # Counting reads every cases file (or YAML tree), so overlap it across
+    # architectures and print each line as soon as it is next in order.
+    with ThreadPoolExecutor(max_workers=min(16, len(names))) as executor:
+        counts = executor.map(_count_test_cases, (archs[n] for n in names))
+        for name, cases_count in zip(names, counts):
+            print(
+                f"  {name:<15} ({cases_count:3d} cases) - {archs[name].description}",
+                flush=True,
+            )
+
+
+@functools.lru_cache(maxsize=256)
+def _count_cases_file(path: str, mtime_ns: int, size: int) -> int:
+    """
+    Count case lines in a text cases file.
+
+    The scan is a single regex pass over the raw bytes. The modification
+    time and size are part of the cache key, so an edited file is recounted.
+    """
+    del mtime_ns  # cache key only
+    if size == 0:
+        return 0
+    with open(path, "rb") as f:
+        if size <= _MMAP_THRESHOLD_BYTES:
+            return len(_CASE_LINE_RE.findall(f.read()))
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return sum(1 for _ in _CASE_LINE_RE.finditer(mapped))
 
 
 def _count_test_cases(config) -> int:
     """Count test cases for an architecture configuration."""
     if config.cases_file is not None:
-        if not config.cases_file.exists():
+        try:
+            stat = config.cases_file.stat()
+            return _count_cases_file(
+                str(config.cases_file), stat.st_mtime_ns, stat.st_size
+            )
+        except OSError:
             return 0
-        count = 0
-        with config.cases_file.open("r") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "#" in line:
-                    count += 1
-        return count
 
     if config.yaml_source is not None:
         try:
@@ -94,6 +159,7 @@ def init_architecture(arch_name: str, test_root: Path) -> None:
 
     try:
         config_path = create_sample_config(arch_name, arch_dir)
+        invalidate_arch_cache()
         print("Created architecture configuration:")
         print(f"  Config: {config_path}")
         print(f"  Cases:  {config_path.parent / 'test_cases.txt'}")
@@ -105,14 +171,169 @@ def init_architecture(arch_name: str, test_root: Path) -> None:
         sys.exit(1)
 
 
+def _run_architecture(
+    runner: "TestRunner",
+    config: ArchConfig,
+    args: argparse.Namespace,
+    stream: TextIO,
+) -> Tuple[Optional["ArchTestSummary"], int]:
+    """Test one architecture, writing its report to stream."""
+    print(f"\n{'='*60}", file=stream)
+    print(f"Testing architecture: {config.name}", file=stream)
+    print(f"{'='*60}", file=stream)
+
+    try:
+        summary = runner.run_arch_tests(
+            config=config,
+            limit=args.limit,
+            verbose=args.verbose,
+            fail_fast=args.fail_fast,
+            stream=stream,
+        )
+        runner.print_summary(
+            summary,
+            show_failures=args.show_failures,
+            show_details=args.show_details,
+            stream=stream,
+        )
+    except Exception as e:
+        print(f"Error testing {config.name}: {e}", file=stream)
+        return None, 1
+
+    # Determine if this architecture passed
+    if summary.mismatches > 0 or summary.command_failures > 0:
+        return summary, 1
+    return summary, 0
+
+
+def _run_architectures(
+    runner: "TestRunner", configs: List[ArchConfig], args: argparse.Namespace
+) -> List[Tuple[Optional["ArchTestSummary"], int]]:
+    """
+    Test the selected architectures and return (summary, rc) for each.
+
+    A single architecture streams its progress straight to stdout. Several
+    architectures run concurrently, sharing the runner's case pool; each
+    report is buffered and printed whole, in selection order. With
+    --fail-fast, the first architecture to finish with a failure stops the
+    run; architectures that had already finished are still reported, the
+    rest are not.
+    """
+    if len(configs) == 1:
+        return [_run_architecture(runner, configs[0], args, sys.stdout)]
+
+    def run_buffered(
+        config: ArchConfig,
+    ) -> Tuple[Tuple[Optional["ArchTestSummary"], int], str]:
+        buffer = io.StringIO()
+        return _run_architecture(runner, config, args, buffer), buffer.getvalue()
+
+    def stop(futures: List[Future]) -> None:
+        for pending in futures:
+            pending.cancel()
+        runner.cancel()
+
+    outcomes = []
+    finished: Dict[int, Tuple[Tuple[Optional["ArchTestSummary"], int], str]] = {}
+
+    def report(index: int) -> None:
+        outcome, output = finished.pop(index)
+        sys.stdout.write(output)
+        sys.stdout.flush()
+        outcomes.append(outcome)
+
+    with ThreadPoolExecutor(max_workers=min(len(configs), runner.jobs)) as executor:
+        futures = [executor.submit(run_buffered, config) for config in configs]
+        indexes = {future: index for index, future in enumerate(futures)}
+        next_index = 0
+        failed: Optional[ArchConfig] = None
+        try:
+            not_done = set(futures)
+            while not_done and failed is None:
+                # React to whichever architecture finishes first, so a failure
+                # late in the selection still stops the others early.
+                done, not_done = wait(not_done, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = indexes[future]
+                    finished[index] = future.result()
+                    if args.fail_fast and finished[index][0][1] != 0:
+                        failed = configs[index]
+                if failed is not None:
+                    stop(futures)
+                while next_index in finished:
+                    report(next_index)
+                    next_index += 1
+        except BaseException:
+            # E.g. Ctrl-C: drain the shared case pool before the executor
+            # joins the architecture threads waiting on it.
+            stop(futures)
+            raise
+
+    if failed is not None:
+        # Architectures that finished before the failure, but behind one
+        # that was still running, have not been printed yet.
+        for index in sorted(finished):
+            report(index)
+        skipped = len(configs) - len(outcomes)
+        if skipped:
+            print(
+                f"\nStopped after {failed.name} (--fail-fast); "
+                f"{skipped} architecture(s) not reported"
+            )
+    return outcomes
+
+
+def _print_overall_summary(
+    outcomes: List[Tuple[Optional["ArchTestSummary"], int]],
+    elapsed_ms: int,
+) -> None:
+    """
+    Print totals across every reported architecture.
+
+    Architectures run concurrently, so the reported time is the wall-clock
+    time of the whole run rather than the sum of per-architecture times.
+    """
+    total_cases = total_matches = total_mismatches = 0
+    total_failures = total_drifts = 0
+    for summary, _ in outcomes:
+        if summary is None:
+            continue
+        total_cases += summary.total_cases
+        total_matches += summary.matches
+        total_mismatches += summary.mismatches
+        total_failures += summary.command_failures
+        total_drifts += summary.documentation_drifts
+
+    print(f"\n{'='*60}")
+    print("Overall Summary")
+    print(f"{'='*60}")
+    print(f"Architectures tested: {len(outcomes)}")
+    print(f"Total test cases:    {total_cases}")
+    total_success_rate = (total_matches / total_cases * 100) if total_cases > 0 else 0.0
+    print(f"Total matches:       {total_matches} ({total_success_rate:.1f}%)")
+    print(f"Total mismatches:    {total_mismatches}")
+    print(f"Total failures:      {total_failures}")
+    print(f"Total drifts:        {total_drifts}")
+    print(f"Total time:          {elapsed_ms}ms")
+
+
 def run_tests(args: argparse.Namespace) -> int:
     """Run tests based on command line arguments."""
+    # pylint: disable=import-outside-toplevel
+    try:
+        from test.core.test_runner import TestRunner
+        from test.core.comparator import OutputComparator
+    except ImportError:  # pragma: no cover - direct script fallback
+        from core.test_runner import TestRunner
+        from core.comparator import OutputComparator
+
     # Setup
-    test_root = Path(__file__).parent
-    runner = TestRunner()
+    runner = TestRunner(
+        jobs=args.jobs, use_cache=args.cache, release=not args.debug_binary
+    )
 
     # Discover architectures
-    archs = discover_arch_configs(test_root)
+    archs = _discover(_TEST_ROOT)
     if not archs:
         print("No architecture configurations found under test/architectures/")
         print("Create one with: python3 test/run_tests.py --init <arch_name>")
@@ -147,67 +368,52 @@ def run_tests(args: argparse.Namespace) -> int:
         return 1
 
     # Run tests
+    start_time = time.perf_counter()
+    try:
+        outcomes = _run_architectures(
+            runner, [archs[name] for name in selected_archs], args
+        )
+    finally:
+        runner.close()
+    elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+
     overall_rc = 0
-    all_summaries = []
+    for _, rc in outcomes:
+        overall_rc |= rc
 
-    for arch_name in selected_archs:
-        config = archs[arch_name]
+    # Print overall summary
+    if len(selected_archs) > 1:
+        _print_overall_summary(outcomes, elapsed_ms)
 
-        print(f"\n{'='*60}")
-        print(f"Testing architecture: {arch_name}")
-        print(f"{'='*60}")
+    return overall_rc
 
-        try:
-            summary = runner.run_arch_tests(
-                config=config,
-                limit=args.limit,
-                verbose=args.verbose,
-                fail_fast=args.fail_fast,
-            )
-            all_summaries.append(summary)
-            runner.print_summary(
-                summary,
-                show_failures=args.show_failures,
-                show_details=args.show_details,
-            )
 
-            # Determine if this architecture passed
-            if summary.mismatches > 0 or summary.command_failures > 0:
-                overall_rc |= 1
+def _positive_int(value: str) -> int:
+    """Parse a strictly positive integer command-line value."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
 
-        except Exception as e:
-            print(f"Error testing {arch_name}: {e}")
-            overall_rc |= 1
 
-    # Print overall summary
-    if len(selected_archs) > 1:
-        print(f"\n{'='*60}")
-        print("Overall Summary")
-        print(f"{'='*60}")
-
-        total_cases = sum(s.total_cases for s in all_summaries)
-        total_matches = sum(s.matches for s in all_summaries)
-        total_mismatches = sum(s.mismatches for s in all_summaries)
-        total_failures = sum(s.command_failures for s in all_summaries)
-        total_drifts = sum(s.documentation_drifts for s in all_summaries)
-        total_time = sum(s.execution_time_ms for s in all_summaries)
-
-        print(f"Architectures tested: {len(selected_archs)}")
-        print(f"Total test cases:    {total_cases}")
-        total_success_rate = (
-            (total_matches / total_cases * 100) if total_cases > 0 else 0.0
+def _non_negative_int(value: str) -> int:
+    """Parse a non-negative integer command-line value."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise argparse.ArgumentTypeError(
+            f"must be a non-negative integer, got {value!r}"
         )
-        print(f"Total matches:       {total_matches} ({total_success_rate:.1f}%)")
-        print(f"Total mismatches:    {total_mismatches}")
-        print(f"Total failures:      {total_failures}")
-        print(f"Total drifts:        {total_drifts}")
-        print(f"Total time:          {total_time}ms")
-
-    return overall_rc
+    return number
 
 
-def main(argv: Optional[List[str]] = None) -> int:
-    """Main entry point."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
     parser = argparse.ArgumentParser(
         description="Robustone Test Framework - Compare with cstool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -234,11 +440,31 @@ Examples:
 
     # Test configuration
     parser.add_argument(
-        "--limit", type=int, help="Limit number of test cases per architecture"
+        "--limit",
+        type=_non_negative_int,
+        metavar="N",
+        help="Limit number of test cases per architecture",
     )
     parser.add_argument(
         "--fail-fast", action="store_true", help="Stop on first failure"
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=_positive_int,
+        metavar="N",
+        help="Number of test cases to run in parallel (default: CPU count)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse tool outputs from previous runs until a binary is rebuilt",
+    )
+    parser.add_argument(
+        "--debug-binary",
+        action="store_true",
+        help="Test the debug build of robustone instead of the release build",
+    )
     parser.add_argument(
         "--show-failures", type=int, default=10, help="Number of failures to display"
     )
@@ -260,16 +486,31 @@ Examples:
     # General options
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
-    args = parser.parse_args(argv)
+    return parser
+
+
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the command-line parser, building it on first use."""
+    global _PARSER  # pylint: disable=global-statement
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    args = _get_parser().parse_args(argv)
 
     # Handle special actions
-    test_root = Path(__file__).parent
     if args.list:
-        list_architectures(test_root)
+        list_architectures(_TEST_ROOT)
         return 0
 
     if args.init:
-        init_architecture(args.init, test_root)
+        init_architecture(args.init, _TEST_ROOT)
         return 0
 
     # Default case: neither --list nor --init was passed
@@ -4,10 +4,28 @@ Generate test cases by running cstool on various instructions.
 """
 
 import argparse
-import subprocess
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+# pylint: disable=wrong-import-position
+try:
+    from test.core.cache import ResultCache
+    from test.core.utils import TOOL_ENV, is_cacheable_result, run_command
+except ImportError:  # pragma: no cover - script-mode fallback
+    from core.cache import ResultCache
+    from core.utils import TOOL_ENV, is_cacheable_result, run_command
+
+# pylint: enable=wrong-import-position
+
+# Default instruction sets, one <arch>.txt file per architecture; this can
+# be expanded by dropping in more files.
+_DATA_DIR = Path(__file__).parent / "data"
 
 
 def find_cstool(repo_root: Path) -> Path:
@@ -18,90 +36,69 @@ def find_cstool(repo_root: Path) -> Path:
     return cstool
 
 
-def run_cstool(cstool_bin: Path, arch: str, instruction: str) -> str:
-    """Run cstool and return its output."""
-    try:
-        result = subprocess.run(
-            [str(cstool_bin), arch, instruction],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        print(f"Error running cstool for {instruction}: {e.stderr}", file=sys.stderr)
+def run_cstool(
+    cstool_bin: Path,
+    arch: str,
+    instruction: str,
+    cache: Optional[ResultCache] = None,
+) -> str:
+    """Run cstool and return its output, consulting the result cache if given."""
+    cmd = [str(cstool_bin), arch, instruction]
+    result = cache.get(cmd) if cache is not None else None
+    if result is None:
+        result = run_command(cmd, env=TOOL_ENV)
+        if cache is not None and is_cacheable_result(result):
+            cache.put(cmd, result)
+
+    returncode, stdout, stderr = result
+    if returncode != 0:
+        print(f"Error running cstool for {instruction}: {stderr}", file=sys.stderr)
         return ""
+    return stdout
 
 
 def generate_test_cases(
-    cstool_bin: Path, arch: str, instructions: List[str], output_file: Path
+    cstool_bin: Path,
+    arch: str,
+    instructions: List[str],
+    output_file: Path,
+    cache: Optional[ResultCache] = None,
 ) -> None:
     """Generate test cases file from instructions."""
-    lines = [
-        f"# Generated test cases for {arch}",
-        "# Format: <hex_bytes> [| <cstool_output>] [| <note>]",
-        "",
-    ]
-
-    for instruction in instructions:
-        output = run_cstool(cstool_bin, arch, instruction)
-        if output:
-            lines.append(f"{instruction}  # {output}")
-        else:
-            lines.append(f"{instruction}  # Failed to get cstool output")
-
-    lines.append("")
-    output_file.write_text("\n".join(lines), encoding="utf-8")
+    # Each cstool call is a short-lived process; overlap them and keep the
+    # original instruction order when writing the results. Lines are written
+    # as soon as they are next in order, so an interrupted run still leaves
+    # the cases generated so far on disk.
+    max_workers = max(1, min(len(instructions), (os.cpu_count() or 1) * 2))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor, output_file.open(
+        "w", encoding="utf-8", buffering=1 << 17
+    ) as f:
+        f.write(
+            f"# Generated test cases for {arch}\n"
+            "# Format: <hex_bytes> [| <cstool_output>] [| <note>]\n"
+            "\n"
+        )
+        outputs = executor.map(
+            lambda instruction: run_cstool(cstool_bin, arch, instruction, cache),
+            instructions,
+        )
+        for instruction, output in zip(instructions, outputs):
+            f.write(f"{instruction}  # {output or 'Failed to get cstool output'}\n")
+
     print(f"Generated {len(instructions)} test cases in {output_file}")
 
 
 def load_instruction_set(arch: str) -> List[str]:
-    """Load instruction sets for different architectures."""
-    # Basic instruction sets - this can be expanded
-    instruction_sets = {
-        "riscv32": [
-            # Arithmetic instructions
-            "00000097", "00000113", "00000193", "00000213", "00000293", "00000313",
-            "00000393", "00000413", "00000493", "00000513", "00000593", "00000613",
-            # Memory instructions
-            "00002303", "00002383", "00002823", "00002c23", "00002023",
-            # Branch instructions
-            "0000a063", "0000b063", "0000c063", "0000d063", "0000e063", "0000f063",
-            # Jump instructions
-            "0000006f", "000000ef", "00000067", "000001e7",
-            # System instructions
-            "00000073", "00100073", "00200073", "00300073",
-            # More complex instructions
-            # "000000b3", "00000033", "00000037", "00000117", "ff010113",
-        ],
-        "riscv64": [
-            # 64-bit specific instructions
-            "37340000", "97820000", "ef008000", "eff01fff",
-            "e7004500", "e700c0ff", "63054100", "e39d61fe",
-            "63ca9300", "6353b500", "6365d600", "6376f700",
-            "03881800", "03994900", "03aa6a00", "03cb2b01",
-            "03dc8c01", "2386ad03", "239ace03", "238fef01",
-            "9300e000", "13a10101", "13b2027d", "13c303dd",
-            "13e4c412", "13f5850c", "1396e601", "13d79701",
-            "13d8f840", "33894901", "b30a7b41", "33acac01",
-            "b33dde01", "33d26240", "b3439400", "33e5c500",
-            "b376f700", "b3543901", "b3503100", "339f0f00",
-            "731504b0", "f3560010", "33057b03", "b3459c03",
-            "3366bd03", "2fa40210", "af236518", "2f272f01",
-            "43f02018", "d3727300", "53f40458", "5385c528",
-            "532edea1", "d38405f0", "530605e0", "537500c0",
-            "d3f005d0", "d31508e0", "87aa7500", "27276601",
-            "43f0201a", "d3727302", "53f4045a", "5385c52a",
-        ],
-        "arm": [
-            # ARM Thumb instructions (16-bit)
-            "0000", "4700", "1800", "1c40", "4018", "4001", "4280", "d100",
-            # ARM instructions (32-bit)
-            "e1a00000", "e0810000", "e0800001", "e1500000", "e3500000",
-        ],
-    }
-
-    return instruction_sets.get(arch, [])
+    """Load the default instruction set for an architecture from scripts/data."""
+    path = _DATA_DIR / f"{arch}.txt"
+    if not path.is_file():
+        return []
+    instructions = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            instructions.append(line)
+    return instructions
 
 
 def main():
@@ -113,6 +110,11 @@ def main():
     )
     parser.add_argument("--output", help="Output file (default: test_cases.txt)")
     parser.add_argument("--cstool", help="Path to cstool binary")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse cstool outputs from previous runs until cstool is rebuilt",
+    )
 
     args = parser.parse_args()
 
@@ -139,12 +141,20 @@ def main():
         output_file = arch_dir / "test_cases.txt"
 
     # Generate test cases
+    cache = None
     try:
-        generate_test_cases(cstool_bin, args.arch, instructions, output_file)
+        if args.cache:
+            cache = ResultCache(
+                repo_root / "target" / "cstool-cache.sqlite3", [cstool_bin]
+            )
+        generate_test_cases(cstool_bin, args.arch, instructions, output_file, cache)
         return 0
     except Exception as e:
         print(f"Error generating test cases: {e}", file=sys.stderr)
         return 1
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,248 @@
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+import sys
+
+# pylint: disable=duplicate-code
+
+TEST_ROOT = Path(__file__).parent
+sys.path.insert(0, str(TEST_ROOT))
+sys.path.insert(0, str(TEST_ROOT / "core"))
+
+# pylint: disable=wrong-import-position
+try:
+    from .core.arch_config import ArchConfig
+    from .core.comparator import ComparisonResult
+    from .core.test_runner import TestRunner
+    from .run_tests import _count_cases_file, _run_architectures
+except ImportError:  # pragma: no cover - script-mode fallback
+    from arch_config import ArchConfig
+    from comparator import ComparisonResult
+    from test_runner import TestRunner
+    from run_tests import _count_cases_file, _run_architectures
+
+ADDI_JSON = (
+    '{"instructions":[{"decoded":{"mnemonic":"addi","opcode_id":"addi",'
+    '"operands":[{"kind":"register","register":{"architecture":"riscv","id":1}},'
+    '{"kind":"register","register":{"architecture":"riscv","id":0}},'
+    '{"kind":"immediate","value":1}],'
+    '"registers_read":[{"architecture":"riscv","id":0}],'
+    '"registers_written":[{"architecture":"riscv","id":1}]}}]}'
+)
+
+# Both fake tools decode every input as "li ra, 1" after a short delay.
+# 00000001 is slow, so it finishes after the cases submitted behind it;
+# robustone prints a bogus decoding for deadbeef, which is a mismatch.
+FAKE_ROBUSTONE = textwrap.dedent(
+    """\
+    #!/bin/sh
+    echo "$*" >> "$(dirname "$0")/calls.log"
+    json=0; hex=""
+    for arg in "$@"; do
+        case "$arg" in
+            --json) json=1 ;;
+            --*) ;;
+            *) hex="$arg" ;;
+        esac
+    done
+    case "$hex" in
+        00000001) sleep 0.3 ;;
+        *) sleep 0.02 ;;
+    esac
+    if [ "$json" = 1 ]; then
+        echo '@ADDI_JSON@'
+    elif [ "$hex" = deadbeef ]; then
+        echo "0  de ad be ef  bogus"
+    else
+        printf '0  93 00 10 00  li\\tra, 1\\n'
+    fi
+    """
+).replace("@ADDI_JSON@", ADDI_JSON)
+
+FAKE_CSTOOL = textwrap.dedent(
+    """\
+    #!/bin/sh
+    printf ' 0  93 00 10 00  li\\t\\t\\tra, 1\\n'
+    case " $* " in
+        *" -d "*)
+            printf '\\tID: 40 (addi)\\n\\top_count: 3\\n'
+            printf '\\t\\toperands[0].type: REG = ra\\n'
+            printf '\\t\\toperands[0].access: WRITE\\n'
+            printf '\\t\\toperands[1].type: REG = zero\\n'
+            printf '\\t\\toperands[1].access: READ\\n'
+            printf '\\t\\toperands[2].type: IMM = 0x1\\n'
+            printf '\\t\\toperands[2].access: READ\\n'
+            ;;
+    esac
+    """
+)
+
+
+def _write_tool(path: Path, script: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(script, encoding="utf-8")
+    path.chmod(0o755)
+
+
+def _old_count(path: Path) -> int:
+    """The original line-by-line case count that _count_cases_file replaced."""
+    count = 0
+    with path.open("r") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "#" in line:
+                count += 1
+    return count
+
+
+@unittest.skipIf(os.name == "nt", "fake tools are POSIX shell scripts")
+class ParallelRunnerTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(tmp.cleanup)
+        self.repo_root = Path(tmp.name)
+        (self.repo_root / "tests" / "differential").mkdir(parents=True)
+        self.robustone = self.repo_root / "target" / "release" / "robustone"
+        _write_tool(self.robustone, FAKE_ROBUSTONE)
+        _write_tool(
+            self.repo_root / "third_party" / "capstone" / "cstool" / "cstool",
+            FAKE_CSTOOL,
+        )
+
+    def _config(self, name, hex_inputs):
+        cases_file = self.repo_root / f"{name}.txt"
+        cases_file.write_text(
+            "".join(f"{hex_input}  # li ra, 1\n" for hex_input in hex_inputs),
+            encoding="utf-8",
+        )
+        return ArchConfig(
+            name=name,
+            robustone_arch="riscv32",
+            cstool_arch="riscv32",
+            cases_file=cases_file,
+        )
+
+    def _runner(self):
+        runner = TestRunner(repo_root=self.repo_root, jobs=4)
+        self.addCleanup(runner.close)
+        return runner
+
+    def test_results_keep_input_order(self):
+        hex_inputs = [f"{index:08x}" for index in range(1, 9)]
+        summary = self._runner().run_arch_tests(self._config("ordered", hex_inputs))
+
+        self.assertEqual([r.hex_input for r in summary.results], hex_inputs)
+        self.assertEqual(summary.matches, len(hex_inputs))
+        self.assertTrue(
+            all(r.result == ComparisonResult.MATCH for r in summary.results)
+        )
+
+    def test_commands_that_fail_to_start_are_not_cached(self):
+        config = self._config("spawn", ["00000002", "00000003"])
+        self.robustone.unlink()
+        runner = TestRunner(repo_root=self.repo_root, jobs=2, use_cache=True)
+        self.addCleanup(runner.close)
+
+        summary = runner.run_arch_tests(config)
+        self.assertEqual(summary.command_failures, 2)
+
+        # Once the binary exists, neither the in-memory nor the persistent
+        # cache may replay the failed launches.
+        _write_tool(self.robustone, FAKE_ROBUSTONE)
+        summary = runner.run_arch_tests(config)
+        self.assertEqual(summary.matches, 2)
+
+    def _run_fail_fast(self, configs):
+        args = argparse.Namespace(
+            limit=None,
+            verbose=False,
+            fail_fast=True,
+            show_failures=10,
+            show_details=False,
+        )
+        runner = self._runner()
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            outcomes = _run_architectures(runner, configs, args)
+        runner.close()
+        return outcomes, output.getvalue()
+
+    def _good_configs(self, count):
+        return [
+            self._config(f"a{index}", [f"{index:02x}{case:06x}" for case in range(40)])
+            for index in range(1, count + 1)
+        ]
+
+    def _robustone_calls(self):
+        log = self.robustone.parent / "calls.log"
+        if not log.exists():
+            return 0
+        return len(log.read_text(encoding="utf-8").splitlines())
+
+    def test_fail_fast_stops_the_other_architectures(self):
+        configs = [self._config("a0bad", ["deadbeef"])] + self._good_configs(3)
+
+        outcomes, output = self._run_fail_fast(configs)
+
+        self.assertEqual(len(outcomes), 1)
+        self.assertEqual(outcomes[0][1], 1)
+        self.assertIn(
+            "Stopped after a0bad (--fail-fast); 3 architecture(s) not reported",
+            output,
+        )
+        # robustone runs twice per case (text and JSON); the other
+        # architectures' 120 cases must not all have been executed.
+        self.assertLess(self._robustone_calls(), 2 * (1 + 120))
+
+    def test_fail_fast_reacts_to_a_failure_selected_last(self):
+        # A missing cases file fails before any case is queued, so the
+        # failure arrives while the architectures ahead of it are running.
+        broken = self._config("a9bad", [])
+        broken.cases_file.unlink()
+        configs = self._good_configs(2) + [broken]
+
+        outcomes, output = self._run_fail_fast(configs)
+
+        self.assertEqual(outcomes, [(None, 1)])
+        self.assertIn("Error testing a9bad: Invalid configuration", output)
+        self.assertIn(
+            "Stopped after a9bad (--fail-fast); 2 architecture(s) not reported",
+            output,
+        )
+        self.assertLess(self._robustone_calls(), 2 * 80)
+
+
+class CaseCountTests(unittest.TestCase):
+    def test_count_matches_line_predicate(self):
+        lines = [
+            "# header comment",
+            "",
+            "   ",
+            "  # indented comment",
+            "\t#tab comment",
+            "37010000  # 0  37 01 00 00  lui sp, 0",
+            "130101ff  # addi sp, sp, -0x10 | note",
+            "b3003100",
+            "  93001000 # indented case",
+            "93001000#",
+            "#93001000 # commented-out case",
+            "deadbeef  # last case",
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            for newline in ("\n", "\r\n"):
+                path = Path(tmp) / "cases.txt"
+                path.write_bytes(newline.join(lines).encode("utf-8") + b"\r\n")
+                stat = path.stat()
+                count = _count_cases_file(str(path), stat.st_mtime_ns, stat.st_size)
+                self.assertEqual(count, _old_count(path))
+                self.assertEqual(count, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from pathlib import Path
+import sys
+
+# pylint: disable=duplicate-code
+
+TEST_ROOT = Path(__file__).parent
+sys.path.insert(0, str(TEST_ROOT))
+sys.path.insert(0, str(TEST_ROOT / "core"))
+
+# pylint: disable=wrong-import-position
+try:
+    from .core.utils import parse_test_case
+except ImportError:  # pragma: no cover - script-mode fallback
+    from utils import parse_test_case
+
+
+class ParseTestCaseTests(unittest.TestCase):
+    def test_blank_and_comment_lines_are_skipped(self):
+        self.assertEqual(parse_test_case(""), ("", "", ""))
+        self.assertEqual(parse_test_case("   \n"), ("", "", ""))
+        self.assertEqual(parse_test_case("  # riscv32 cases"), ("", "", ""))
+
+    def test_bare_hex_input(self):
+        self.assertEqual(parse_test_case("37010000\n"), ("37010000", "", ""))
+
+    def test_expected_output_and_note_are_trimmed(self):
+        self.assertEqual(
+            parse_test_case("130101ff  #  addi sp, sp, -0x10 |  stack setup \n"),
+            ("130101ff", "addi sp, sp, -0x10", "stack setup"),
+        )
+
+    def test_only_first_separators_split_fields(self):
+        self.assertEqual(
+            parse_test_case("b3003100 # add ra, sp, gp | note | cstool_arch=riscv64"),
+            ("b3003100", "add ra, sp, gp", "note | cstool_arch=riscv64"),
+        )
+        self.assertEqual(
+            parse_test_case("b3003100 # add # ra"),
+            ("b3003100", "add # ra", ""),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# pylint: disable=duplicate-code
+
+TEST_ROOT = Path(__file__).parent
+sys.path.insert(0, str(TEST_ROOT))
+sys.path.insert(0, str(TEST_ROOT / "core"))
+
+# pylint: disable=wrong-import-position
+try:
+    from .core.cache import ResultCache
+except ImportError:  # pragma: no cover - script-mode fallback
+    from cache import ResultCache
+
+
+class ResultCacheTests(unittest.TestCase):
+    def test_cached_result_survives_reopen(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            binary = Path(tmp) / "robustone"
+            binary.write_text("v1", encoding="utf-8")
+            db = Path(tmp) / "cache" / "results.sqlite3"
+
+            cache = ResultCache(db, [binary])
+            cache.put(["robustone", "riscv32", "93001000"], (0, "li ra, 1", ""))
+            cache.close()
+
+            reopened = ResultCache(db, [binary])
+            self.assertEqual(
+                reopened.get(["robustone", "riscv32", "93001000"]),
+                (0, "li ra, 1", ""),
+            )
+            self.assertIsNone(reopened.get(["robustone", "riscv64", "93001000"]))
+            reopened.close()
+
+    def test_rebuilt_binary_invalidates_entries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            binary = Path(tmp) / "robustone"
+            binary.write_text("v1", encoding="utf-8")
+            db = Path(tmp) / "results.sqlite3"
+
+            cache = ResultCache(db, [binary])
+            cache.put(["robustone", "riscv32", "93001000"], (0, "li ra, 1", ""))
+            cache.close()
+
+            stat = binary.stat()
+            os.utime(binary, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            reopened = ResultCache(db, [binary])
+            self.assertIsNone(reopened.get(["robustone", "riscv32", "93001000"]))
+            reopened.close()
+
+    def test_rows_from_previous_builds_are_pruned_on_open(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            binary = Path(tmp) / "robustone"
+            binary.write_text("v1", encoding="utf-8")
+            db = Path(tmp) / "results.sqlite3"
+
+            cache = ResultCache(db, [binary])
+            cache.put(["robustone", "riscv32", "93001000"], (0, "li ra, 1", ""))
+            cache.put(["robustone", "riscv32", "13000000"], (0, "nop", ""))
+            cache.close()
+
+            binary.write_text("v2, rebuilt", encoding="utf-8")
+            reopened = ResultCache(db, [binary])
+            reopened.put(["robustone", "riscv32", "93001000"], (0, "li ra, 1", ""))
+            reopened.close()
+
+            with sqlite3.connect(str(db)) as conn:
+                (rows,) = conn.execute("SELECT COUNT(*) FROM tool_results").fetchone()
+            self.assertEqual(rows, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()